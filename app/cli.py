@@ -0,0 +1,71 @@
+import os
+from enum import Enum
+
+import typer
+import uvicorn
+
+cli = typer.Typer()
+
+
+@cli.callback()
+def main():
+    """
+    Place Wrapper service commands.
+    """
+
+
+class Loop(str, Enum):
+    auto = "auto"
+    asyncio = "asyncio"
+    uvloop = "uvloop"
+
+
+class Http(str, Enum):
+    auto = "auto"
+    h11 = "h11"
+    httptools = "httptools"
+
+
+def default_workers() -> int:
+    """WEB_CONCURRENCY if set, otherwise one worker per CPU."""
+    return int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+
+@cli.command()
+def serve(
+    host: str = typer.Option("0.0.0.0", help="Bind address"),
+    port: int = typer.Option(8080, help="Bind port"),
+    workers: int = typer.Option(None, help="Worker processes (default: WEB_CONCURRENCY or CPU count)"),
+    loop: Loop = typer.Option(Loop.uvloop, help="Event loop implementation"),
+    http: Http = typer.Option(Http.httptools, help="HTTP protocol implementation"),
+    reload: bool = typer.Option(False, help="Reload on code changes (development only, single worker)"),
+):
+    """
+    Run the production server.
+    """
+    workers = 1 if reload else (workers or default_workers())
+    # Workers read this to size their own pools (see NORMALIZE_MAX_WORKERS)
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+
+    # Import the application in the parent so configuration errors surface before workers start
+    import app.main  # noqa: F401
+    from app.config.settings import FORWARDED_ALLOW_IPS
+
+    uvicorn.run(
+        "app.main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop=loop.value,
+        http=http.value,
+        reload=reload,
+        proxy_headers=True,
+        forwarded_allow_ips=FORWARDED_ALLOW_IPS,
+        server_header=False,
+        # Access lines are written by request_id_middleware through the log queue
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    cli()
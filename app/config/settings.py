@@ -7,3 +7,69 @@ GOOGLE_MAPS_API_KEY = os.getenv("GOOGLEMAPSAPIKEY")
 
 if not GOOGLE_MAPS_API_KEY:
     raise ValueError("GOOGLE_MAPS_API_KEY is not set in the environment variables.")
+
+# Upstream endpoints (overridable so benchmarks can point at a local stand-in)
+GOOGLE_PLACES_API_URL = os.getenv("GOOGLE_PLACES_API_URL", "https://places.googleapis.com/v1")
+GOOGLE_GEOCODE_API_URL = os.getenv(
+    "GOOGLE_GEOCODE_API_URL", "https://maps.googleapis.com/maps/api/geocode/json"
+)
+
+# Outbound HTTP
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+
+# Startup warmup and readiness
+WARMUP_CONNECTIONS = int(os.getenv("WARMUP_CONNECTIONS", 4))
+# Seconds an upstream reachability probe result is reused by /readyz
+UPSTREAM_PROBE_TTL = float(os.getenv("UPSTREAM_PROBE_TTL", 30))
+
+# Admission control (applies to upstream calls only, cache hits are never limited)
+ADMISSION_MAX_CONCURRENCY = int(os.getenv("ADMISSION_MAX_CONCURRENCY", 50))
+ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", 100))
+# Seconds a request may wait for an upstream slot before being rejected
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", 2))
+# Per-route concurrency overrides, e.g. "places=20,text_search=10"
+ADMISSION_ROUTE_LIMITS = os.getenv("ADMISSION_ROUTE_LIMITS", "")
+
+# Per-client rate limiting, stored in Redis (0 disables it)
+RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", 0))
+# Peer addresses (e.g. internal gateways) allowed to name the client via X-Client-ID
+RATE_LIMIT_TRUSTED_CLIENTS = {
+    ip.strip() for ip in os.getenv("RATE_LIMIT_TRUSTED_CLIENTS", "").split(",") if ip.strip()
+}
+# Proxies whose X-Forwarded-For is trusted for the client address (comma-separated IPs/CIDRs,
+# "*" for any). Behind a gateway this must include it, or every client shares its address.
+FORWARDED_ALLOW_IPS = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+# Answer text searches from cached nearby searches when possible
+QUERY_PLANNER_ENABLED = os.getenv("QUERY_PLANNER_ENABLED", "true").lower() == "true"
+
+# Response compression and ETags
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+# Compressed bodies kept in memory per worker, keyed by ETag
+COMPRESSION_CACHE_SIZE = int(os.getenv("COMPRESSION_CACHE_SIZE", 256))
+
+# CPU offload of normalization for large payloads
+NORMALIZE_EXECUTOR = os.getenv("NORMALIZE_EXECUTOR", "auto")  # "auto", "process", "thread" or "off"
+# Raw Google response bodies of at least this many bytes are parsed and normalized
+# off the event loop. A full 20-place page is ~90 KB, a 5-place page ~20 KB.
+NORMALIZE_OFFLOAD_MIN_BYTES = int(os.getenv("NORMALIZE_OFFLOAD_MIN_BYTES", 32768))
+# Each web worker has its own pool, so split the CPUs between them
+_WEB_WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", 1)))
+NORMALIZE_MAX_WORKERS = int(
+    os.getenv("NORMALIZE_MAX_WORKERS", max(1, (os.cpu_count() or 1) // _WEB_WORKERS))
+)
+# Offloaded jobs allowed in flight per worker; further jobs wait for a slot
+NORMALIZE_MAX_PENDING = int(os.getenv("NORMALIZE_MAX_PENDING", 2 * NORMALIZE_MAX_WORKERS))
+
+# Cache keys
+# Optional override of cache_keys.SCHEMA_VERSION, e.g. to isolate a canary deploy
+CACHE_SCHEMA_VERSION_OVERRIDE = os.getenv("CACHE_SCHEMA_VERSION")
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "pw")
+
+# Logging
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")  # "json" or "text"
+# Fraction of requests (0.0 - 1.0) whose raw upstream payloads get logged at DEBUG
+LOG_PAYLOAD_SAMPLE_RATE = float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", 0.01))
@@ -1,12 +1,18 @@
-import httpx
 import json
 
 from app.models.autocomplete_places.request_models import AutocompleteSearch
 from app.models.autocomplete_places.response_models import Suggestion, Suggestions_List
-from app.config.settings import GOOGLE_MAPS_API_KEY
+from app.config.settings import GOOGLE_MAPS_API_KEY, GOOGLE_PLACES_API_URL
 from app.services.redis_client import redis_client
+from app.services.http_client import get_http_client
+from app.services.admission import upstream_slot
+from app.services import cache_keys
+from app.services.cache_keys import build_cache_key
+from app.services.logger import get_logger, log_payload
 
-BASE_GOOGLE_URL = "https://places.googleapis.com/v1/places:autocomplete"
+BASE_GOOGLE_URL = f"{GOOGLE_PLACES_API_URL}/places:autocomplete"
+
+logger = get_logger(__name__)
 
 
 async def autocomplete_places(request: AutocompleteSearch):
@@ -19,10 +25,10 @@ async def autocomplete_places(request: AutocompleteSearch):
     input_text = request.input
 
     # Generate a Redis cache key
-    cache_key = f"autocomplete:{input_text}"
+    cache_key = build_cache_key(cache_keys.AUTOCOMPLETE, input=input_text)
     cached_data = await redis_client.get(cache_key)
     if cached_data:
-        print("FROM CACHE")
+        logger.debug("Cache hit for %s", cache_key)
         return json.loads(cached_data)
 
     # Prepare API request headers
@@ -35,12 +41,17 @@ async def autocomplete_places(request: AutocompleteSearch):
     payload = {
         "input": input_text,
     }
+    if request.sessionToken:
+        payload["sessionToken"] = request.sessionToken
 
     # Make the API request
-    async with httpx.AsyncClient() as client:
+    async with upstream_slot(cache_keys.AUTOCOMPLETE):
+        client = get_http_client()
         response = await client.post(BASE_GOOGLE_URL, json=payload, headers=headers)
         data = response.json()
 
+    log_payload(logger, "Google autocomplete response", data)
+
     # Initialize the suggestions list
     suggestions = []
 
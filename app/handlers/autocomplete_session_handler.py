@@ -0,0 +1,89 @@
+import asyncio
+import json
+import uuid
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from app.handlers.autocomplete_places_handler import autocomplete_places
+from app.models.autocomplete_places.request_models import AutocompleteSearch
+from app.models.autocomplete_places.response_models import Suggestions_List
+from app.services.admission import Overloaded
+from app.services.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def run_autocomplete_session(websocket: WebSocket):
+    """
+    Serve one autocomplete session.
+
+    The server opens a Google session token and sends it first as
+    {"sessionToken": ...}; clients pass it to GET /places/{place_id} when the
+    user picks a suggestion. That call ends Google's billing session, so the
+    client then sends {"selected": "<place_id>"} and receives a fresh
+    {"sessionToken": ...} for the next search on the same connection.
+    Each {"input": ...} message supersedes the previous one: its in-flight
+    upstream call is cancelled, so only the latest input is answered with
+    {"seq", "input", "suggestions_list"}.
+    """
+    await websocket.accept()
+    session_token = str(uuid.uuid4())
+    await websocket.send_json({"sessionToken": session_token})
+
+    in_flight: asyncio.Task | None = None
+    seq = 0
+
+    async def resolve(seq: int, input_text: str, session_token: str):
+        reply = {"seq": seq, "input": input_text}
+        try:
+            if input_text.strip():
+                suggestions = await autocomplete_places(
+                    AutocompleteSearch(input=input_text, sessionToken=session_token)
+                )
+            else:
+                suggestions = []
+            reply.update(Suggestions_List(suggestions_list=suggestions).model_dump())
+        except Overloaded as e:
+            reply.update(error=str(e), retry_after=e.retry_after)
+        except Exception:
+            logger.exception("Autocomplete failed for session %s", session_token)
+            reply["error"] = "Autocomplete failed"
+
+        try:
+            await websocket.send_json(reply)
+        except Exception:
+            # The client went away while this lookup was resolving
+            logger.debug("Dropping reply %d for closed session %s", seq, session_token)
+
+    try:
+        while True:
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                break
+            try:
+                message = json.loads(frame["text"]) if frame.get("text") is not None else None
+            except ValueError:
+                message = None
+
+            if isinstance(message, dict) and "selected" in message:
+                # The pick closed the billing session; start a new one
+                if in_flight is not None and not in_flight.done():
+                    in_flight.cancel()
+                session_token = str(uuid.uuid4())
+                await websocket.send_json({"sessionToken": session_token})
+                continue
+
+            input_text = message.get("input") if isinstance(message, dict) else None
+            if not isinstance(input_text, str):
+                await websocket.send_json({"error": 'Expected {"input": "<text>"}'})
+                continue
+
+            if in_flight is not None and not in_flight.done():
+                in_flight.cancel()
+            seq += 1
+            in_flight = asyncio.create_task(resolve(seq, input_text, session_token))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if in_flight is not None and not in_flight.done():
+            in_flight.cancel()
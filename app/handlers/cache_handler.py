@@ -0,0 +1,55 @@
+import json
+from typing import AsyncIterable, AsyncIterator
+
+from app.services.redis_client import redis_client
+
+# Entries written to Redis per pipelined round trip during import
+IMPORT_BATCH_SIZE = 500
+
+
+async def export_entries(pattern: str) -> AsyncIterator[str]:
+    """
+    Stream every cache entry matching a pattern as NDJSON lines of
+    {"key": ..., "value": ..., "ttl": ...}.
+    """
+    async for key, value, ttl in redis_client.scan_entries(pattern):
+        yield json.dumps({"key": key, "value": value, "ttl": ttl}) + "\n"
+
+
+async def import_entries(chunks: AsyncIterable[bytes]) -> int:
+    """
+    Store NDJSON entries (as produced by export_entries) from a byte stream.
+    The whole stream is parsed and validated first, so a bad line rejects the
+    import before anything is written; entries are then stored in pipelined batches.
+    """
+    entries = []
+    buffer = b""
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                entries.append(_parse_line(line))
+
+    if buffer.strip():
+        entries.append(_parse_line(buffer))
+
+    imported = 0
+    for start in range(0, len(entries), IMPORT_BATCH_SIZE):
+        imported += await redis_client.mset(entries[start:start + IMPORT_BATCH_SIZE])
+    return imported
+
+
+def _parse_line(line: bytes) -> tuple[str, str, int | None]:
+    try:
+        entry = json.loads(line)
+        key, value = entry["key"], entry["value"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError(f"Invalid cache entry: {line[:200]!r}")
+    if not isinstance(key, str) or not isinstance(value, str):
+        raise ValueError(f"Cache entry key and value must be strings: {key!r}")
+    ttl = entry.get("ttl")
+    if ttl is not None and (isinstance(ttl, bool) or not isinstance(ttl, int) or ttl <= 0):
+        raise ValueError(f"Cache entry ttl must be a positive integer or null: {key!r}")
+    return key, value, ttl
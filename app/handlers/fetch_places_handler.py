@@ -1,4 +1,3 @@
-import httpx
 import json
 from app.models.get_place.response_model import PriceRange
 from app.models.fetch_places.request_models import PlacesRequest
@@ -9,10 +8,20 @@ from app.models.fetch_places.response_models import (
     PlacePhoto,
     AccessibilityOptions,
 )
-from app.config.settings import GOOGLE_MAPS_API_KEY
+from app.config.settings import GOOGLE_MAPS_API_KEY, GOOGLE_PLACES_API_URL
 from app.services.redis_client import redis_client
+from app.services.http_client import get_http_client
+from app.services.admission import upstream_slot
+from app.services import cache_keys
+from app.services.cache_keys import build_cache_key
+from app.services.logger import get_logger, log_payload
+from app.services.query_planner import register_nearby_result
+from app.services.singleflight import singleflight
+from app.services.executor import run_normalization
 
-BASE_GOOGLE_URL = "https://places.googleapis.com/v1/places:searchNearby"
+BASE_GOOGLE_URL = f"{GOOGLE_PLACES_API_URL}/places:searchNearby"
+
+logger = get_logger(__name__)
 
 
 async def fetch_places(
@@ -35,12 +44,33 @@ async def fetch_places(
         return {"error": "A place type cannot be both included and excluded"}
 
     # Generate a Redis cache key
-    cache_key = f"places:{latitude}:{longitude}:{radius}:{','.join(included_types)}:{','.join(excluded_types)}"
+    cache_key = build_cache_key(
+        cache_keys.PLACES,
+        latitude=latitude,
+        longitude=longitude,
+        radius=radius,
+        included=included_types,
+        excluded=excluded_types,
+    )
     cached_data = await redis_client.get(cache_key)
     if cached_data:
-        print("FROM CACHE")
+        logger.debug("Cache hit for %s", cache_key)
         return json.loads(cached_data)
 
+    # Identical concurrent misses share one upstream call
+    return await singleflight(cache_key, lambda: _search_nearby(request, cache_key))
+
+
+async def _search_nearby(request: PlacesRequest, cache_key: str):
+    """
+    Call Google searchNearby, normalize the places and cache them.
+    """
+    latitude = request.location.latitude
+    longitude = request.location.longitude
+    radius = request.radius
+    included_types = request.includedTypes
+    excluded_types = request.excludedTypes
+
     # Prepare API request headers
     headers = {
         "Content-Type": "application/json",
@@ -68,28 +98,33 @@ async def fetch_places(
     }
 
     # Make request to Google API
-    async with httpx.AsyncClient() as client:
+    async with upstream_slot(cache_keys.PLACES):
+        client = get_http_client()
         response = await client.post(BASE_GOOGLE_URL, json=payload, headers=headers)
-        data = response.json()
 
-    # Validate API response
-    if "places" not in data:
-        return {"error": "Invalid response from Google API", "details": data}
+    log_payload(logger, "Google nearby search response", response.json)
 
-    # Normalize response
-    normalized_data = normalize_google_response(data["places"])
+    # Parse and normalize the body (large bodies off the event loop)
+    raw = response.content
+    result = await run_normalization(normalize_google_payload, raw, size=len(raw))
+
+    # Validate API response
+    if result is None:
+        return {"error": "Invalid response from Google API", "details": response.json()}
+    normalized_json, next_page_token = result
 
     # Cache the normalized response in Redis for 1 hour
-    await redis_client.set(
-        cache_key,
-        json.dumps([place.model_dump() for place in normalized_data]),
-        expire=3600,
-    )
+    await redis_client.set(cache_key, normalized_json, expire=3600)
+    normalized_data = json.loads(normalized_json)
+    # Let text searches reuse this result set (see app/services/query_planner.py)
+    if included_types and not excluded_types:
+        await register_nearby_result(
+            cache_key, latitude, longitude, radius, included_types, len(normalized_data)
+        )
 
-    next_page_token = data.get("next_page_token", None)
     if next_page_token:
-        return [place.model_dump() for place in normalized_data], next_page_token
-    return [place.model_dump() for place in normalized_data]
+        return normalized_data, next_page_token
+    return normalized_data
 
 
 def normalize_google_response(places):
@@ -128,7 +163,6 @@ def normalize_google_response(places):
         # pricing range
         google_range=place.get("priceRange",None)
         if google_range is not None:
-            print(google_range)
             start_price=int(google_range.get("startPrice").get("units"))
             # when a place is $100+ i just set the end_price to 500$ for limitations and type structure purposes
             end_price=int(google_range.get("endPrice",{"units":500}).get("units"))
@@ -161,5 +195,24 @@ def normalize_google_response(places):
                 goodForGroups=place.get("goodForGroups", False),
             )
         )
-        print(normalized)
     return normalized
+
+
+def normalize_google_response_json(places) -> str:
+    """
+    Normalize places and serialize them in one step.
+    Returning a JSON string keeps the transfer cheap when this runs in a worker process.
+    """
+    return json.dumps([place.model_dump() for place in normalize_google_response(places)])
+
+
+def normalize_google_payload(raw: bytes) -> tuple[str, str | None] | None:
+    """
+    Parse a raw searchNearby/searchText response body and normalize its places.
+    Returns (places JSON, next page token), or None if the body has no places.
+    Taking the undecoded body moves JSON parsing into the worker as well.
+    """
+    data = json.loads(raw)
+    if "places" not in data:
+        return None
+    return normalize_google_response_json(data["places"]), data.get("next_page_token")
@@ -1,12 +1,18 @@
-import httpx
 import json
 
 from app.models.get_photos.request_models import Photo_gRPC
 from app.models.get_photos.response_models import Photo
-from app.config.settings import GOOGLE_MAPS_API_KEY
+from app.config.settings import GOOGLE_MAPS_API_KEY, GOOGLE_PLACES_API_URL
 from app.services.redis_client import redis_client
+from app.services.http_client import get_http_client
+from app.services.admission import upstream_slot
+from app.services import cache_keys
+from app.services.cache_keys import build_cache_key
+from app.services.logger import get_logger, log_payload
 
-BASE_GOOGLE_URL = "https://places.googleapis.com/v1/"
+BASE_GOOGLE_URL = f"{GOOGLE_PLACES_API_URL}/"
+
+logger = get_logger(__name__)
 
 async def get_photo(request: Photo_gRPC):
     """
@@ -17,11 +23,13 @@ async def get_photo(request: Photo_gRPC):
     max_width = request.maxWidthPx
     max_height = request.maxHeightPx
 
-    cache_key = f"photo:{photo_reference}"
+    cache_key = build_cache_key(
+        cache_keys.PHOTO, photo_reference, width=max_width, height=max_height
+    )
 
     cached_photo = await redis_client.get(cache_key)
     if cached_photo:
-        print("FROM CACHE")
+        logger.debug("Cache hit for %s", cache_key)
         return Photo(**json.loads(cached_photo))
     
     photo_url = f"{BASE_GOOGLE_URL}{photo_reference}/media?maxWidthPx={max_width}&maxHeightPx={max_height}"
@@ -30,11 +38,12 @@ async def get_photo(request: Photo_gRPC):
         "X-Goog-Api-Key": GOOGLE_MAPS_API_KEY
     }
 
-    async with httpx.AsyncClient() as client:
+    async with upstream_slot(cache_keys.PHOTO):
+        client = get_http_client()
         response = await client.get(photo_url, headers=headers)
         data = response.json()
 
-    print("GOOGLE API RESPONSE:", json.dumps(data, indent=2))
+    log_payload(logger, "Google photo response", data)
 
     if "photoUri" in data:
         photo_uri = data["photoUri"]
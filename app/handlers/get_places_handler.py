@@ -1,22 +1,29 @@
-import httpx
 import json
 
 from app.models.get_place.response_model import GetPlaceResponse, PriceRange
 from app.models.get_place.response_model import OpeningPeriod
-from app.config.settings import GOOGLE_MAPS_API_KEY
+from app.config.settings import GOOGLE_MAPS_API_KEY, GOOGLE_PLACES_API_URL
 from app.services.redis_client import redis_client
+from app.services.http_client import get_http_client
+from app.services.admission import upstream_slot
+from app.services import cache_keys
+from app.services.cache_keys import build_cache_key
+from app.services.logger import get_logger, log_payload
 
-BASE_GOOGLE_URL = "https://places.googleapis.com/v1/places"
+BASE_GOOGLE_URL = f"{GOOGLE_PLACES_API_URL}/places"
 
-async def get_place_info(place_id: str) -> GetPlaceResponse:
+logger = get_logger(__name__)
+
+async def get_place_info(place_id: str, session_token: str | None = None) -> GetPlaceResponse:
     """
     Get place information from Google Places API.
+    Passing the autocomplete session token closes that billing session.
     """
-    cache_key = f"place_info_{place_id}"
+    cache_key = build_cache_key(cache_keys.PLACE_INFO, place_id)
     cached_response = await redis_client.get(cache_key)
 
     if cached_response:
-        print("FROM CACHE")
+        logger.debug("Cache hit for %s", cache_key)
         return json.loads(cached_response)
     
     fields = (
@@ -27,16 +34,19 @@ async def get_place_info(place_id: str) -> GetPlaceResponse:
     )
     url = f"{BASE_GOOGLE_URL}/{place_id}"
     params = {"fields": fields}
+    if session_token:
+        params["sessionToken"] = session_token
     headers = {
         "Content-Type": "application/json",
         "X-Goog-Api-Key": GOOGLE_MAPS_API_KEY,
     }
-    async with httpx.AsyncClient() as client:
+    async with upstream_slot(cache_keys.PLACE_INFO):
+        client = get_http_client()
         response = await client.get(url, headers=headers, params=params)
         response.raise_for_status()
         data = response.json()
 
-    print("GOOGLE RESPONSE", data)
+    log_payload(logger, "Google place details response", data)
 
     normalized_data = normalize_place_response(data)
 
@@ -110,7 +120,6 @@ def normalize_place_response(data):
     # pricing range
     google_range=place.get("priceRange",None)
     if google_range is not None:
-        print(google_range)
         start_price=int(google_range.get("startPrice").get("units"))
         end_price=int(google_range.get("endPrice").get("units"))
         currency=str(google_range.get("startPrice").get("currencyCode"))
@@ -1,12 +1,18 @@
-import httpx
 import json
 
-from app.config.settings import GOOGLE_MAPS_API_KEY
+from app.config.settings import GOOGLE_MAPS_API_KEY, GOOGLE_GEOCODE_API_URL
 from app.services.redis_client import redis_client
+from app.services.http_client import get_http_client
+from app.services.admission import upstream_slot
+from app.services import cache_keys
+from app.services.cache_keys import build_cache_key
+from app.services.logger import get_logger, log_payload
 from app.models.search_coordinates.request_models import PlaceName
 from app.models.search_coordinates.response_models import Location
 
-BASE_GOOGLE_URL = "https://maps.googleapis.com/maps/api/geocode/json?"
+BASE_GOOGLE_URL = GOOGLE_GEOCODE_API_URL
+
+logger = get_logger(__name__)
 
 
 async def search_coordinates(request: PlaceName):
@@ -19,10 +25,10 @@ async def search_coordinates(request: PlaceName):
     place_name = request.place_name
 
     # Generate a Redis cache key
-    cache_key = f"coordinates:{place_name}"
+    cache_key = build_cache_key(cache_keys.COORDINATES, place_name=place_name)
     cached_data = await redis_client.get(cache_key)
     if cached_data:
-        print("FROM CACHE")
+        logger.debug("Cache hit for %s", cache_key)
         return json.loads(cached_data)
 
     # Prepare API request headers (no need for extra headers)
@@ -34,12 +40,13 @@ async def search_coordinates(request: PlaceName):
     payload = {"address": place_name, "key": GOOGLE_MAPS_API_KEY}
 
     # Make the API request
-    async with httpx.AsyncClient() as client:
+    async with upstream_slot(cache_keys.COORDINATES):
+        client = get_http_client()
         response = await client.get(BASE_GOOGLE_URL, headers=headers, params=payload)
         response.raise_for_status()  # Raise an error for bad responses
         data = response.json()
 
-    print("GOOGLE API RAW RESPONSE:", json.dumps(data, indent=2))
+    log_payload(logger, "Google geocode response", data)
 
     # Normalize the response
     if data.get("results"):
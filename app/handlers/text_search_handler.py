@@ -1,4 +1,3 @@
-import httpx
 import json
 
 from app.models.text_search.request_models import TextSearchRequest
@@ -9,11 +8,21 @@ from app.models.fetch_places.response_models import (
     PlacePhoto,
     AccessibilityOptions,
 )
-from app.config.settings import GOOGLE_MAPS_API_KEY
+from app.config.settings import GOOGLE_MAPS_API_KEY, GOOGLE_PLACES_API_URL
 from app.services.redis_client import redis_client
-from app.handlers.fetch_places_handler import normalize_google_response
+from app.services.http_client import get_http_client
+from app.services.admission import upstream_slot
+from app.services import cache_keys
+from app.services.cache_keys import build_cache_key
+from app.services.logger import get_logger, log_payload
+from app.services.query_planner import plan_text_search
+from app.services.singleflight import singleflight
+from app.services.executor import run_normalization
+from app.handlers.fetch_places_handler import normalize_google_payload
 
-BASE_GOOGLE_URL = "https://places.googleapis.com/v1/places:searchText"
+BASE_GOOGLE_URL = f"{GOOGLE_PLACES_API_URL}/places:searchText"
+
+logger = get_logger(__name__)
 
 async def text_search(request: TextSearchRequest) -> list[PlaceResponse]:
     """
@@ -28,12 +37,36 @@ async def text_search(request: TextSearchRequest) -> list[PlaceResponse]:
     radius = request.radius
     
     # Generate a Redis cache key
-    cache_key = f"text_search:{query}:{latitude}:{longitude}:{radius}"
+    cache_key = build_cache_key(
+        cache_keys.TEXT_SEARCH,
+        query=query,
+        latitude=float(latitude),
+        longitude=float(longitude),
+        radius=radius,
+    )
     cached_data = await redis_client.get(cache_key)
     if cached_data:
-        print("FROM CACHE")
+        logger.debug("Cache hit for %s", cache_key)
         return json.loads(cached_data)
-    
+
+    # Answer from a cached nearby search covering the same area, if there is one
+    planned = await plan_text_search(query, float(latitude), float(longitude), radius)
+    if planned is not None:
+        return planned
+
+    # Identical concurrent misses share one upstream call
+    return await singleflight(cache_key, lambda: _search_text(request, cache_key))
+
+
+async def _search_text(request: TextSearchRequest, cache_key: str) -> list[dict]:
+    """
+    Call Google searchText, normalize the places and cache them.
+    """
+    query = request.query
+    latitude = request.location["latitude"]
+    longitude = request.location["longitude"]
+    radius = request.radius
+
     # Prepare API request headers
     headers = {
         "Content-Type": "application/json",
@@ -64,22 +97,22 @@ async def text_search(request: TextSearchRequest) -> list[PlaceResponse]:
     }
     
     # Make request to Google API
-    async with httpx.AsyncClient() as client:
+    async with upstream_slot(cache_keys.TEXT_SEARCH):
+        client = get_http_client()
         response = await client.post(BASE_GOOGLE_URL, json=payload, headers=headers)
-        data = response.json()
+
+    log_payload(logger, "Google text search response", response.json)
     
+    # Parse and normalize the body (large bodies off the event loop)
+    raw = response.content
+    result = await run_normalization(normalize_google_payload, raw, size=len(raw))
+
     # Validate API response
-    if "places" not in data:
+    if result is None:
         return []
-    
-    # Normalize response
-    normalized_data = normalize_google_response(data["places"])
+    normalized_json, _ = result
     
     # Cache the normalized response in Redis for 1 hour
-    await redis_client.set(
-        cache_key,
-        json.dumps([place.model_dump() for place in normalized_data]),
-        expire=3600,
-    )
+    await redis_client.set(cache_key, normalized_json, expire=3600)
     
-    return [place.model_dump() for place in normalized_data] 
\ No newline at end of file
+    return json.loads(normalized_json) 
\ No newline at end of file
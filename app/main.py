@@ -1,16 +1,50 @@
-from fastapi import FastAPI, Body
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config.settings import WARMUP_CONNECTIONS
 from app.services.redis_client import redis_client
+from app.services import http_client
+from app.services.executor import shutdown_executor
+from app.services.responses import ORJSONResponse
+from app.services.admission import Overloaded, overloaded_handler, rate_limit_middleware
+from app.services.conditional import conditional_response_middleware
+from app.services.logger import setup_logging, get_logger, request_id_middleware
 from app.routes import base_router
+from app.routes import cache_router
+from app.routes import health_router
 from app.routes import places_router
 from app.routes import search_router
 
-app = FastAPI()
+setup_logging()
+logger = get_logger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the Redis and upstream HTTP pools before reporting ready, close them on shutdown."""
+    app.state.warmed_up = False
+    cache_ready, upstream_ready = await asyncio.gather(
+        redis_client.warmup(WARMUP_CONNECTIONS),
+        http_client.warmup(WARMUP_CONNECTIONS),
+    )
+    logger.info("Warmup finished (cache=%s, upstream=%s)", cache_ready, upstream_ready)
+    app.state.warmed_up = True
+    yield
+    await http_client.close_http_client()
+    shutdown_executor()
+    await redis_client.close()
+
 
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+app.include_router(health_router.router)
 app.include_router(base_router.router)
 app.include_router(places_router.router)
 app.include_router(search_router.router)
+app.include_router(cache_router.router)
 
 origins = [
     "http://localhost:8080",
@@ -25,18 +59,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.middleware("http")(conditional_response_middleware)
+app.middleware("http")(rate_limit_middleware)
+app.middleware("http")(request_id_middleware)
+app.add_exception_handler(Overloaded, overloaded_handler)
+
 @app.get("/")
 async def root():
     return {"message": "Place Wrapper is Running!"}
-
-@app.post("/cache/{key}")
-async def set_cache(key: str, value: str = Body(..., embed=True)):
-    await redis_client.set(key, value)
-    return {"message": f"Stored {key} -> {value}"}
-
-@app.get("/cache/{key}")
-async def get_cache(key: str):
-    value = await redis_client.get(key)
-    if value:
-        return {"key": key, "value": value}
-    return {"message": "Key not found"}
\ No newline at end of file
@@ -1,4 +1,7 @@
 from pydantic import BaseModel
+from typing import Optional
 
 class AutocompleteSearch (BaseModel):
-    input: str
\ No newline at end of file
+    input: str
+    # Groups autocomplete calls and the final place details call into one billing session
+    sessionToken: Optional[str] = None
\ No newline at end of file
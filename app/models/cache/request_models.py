@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class CacheKeys(BaseModel):
+    keys: List[str] = Field(..., description="Keys to fetch")
+
+
+class CacheItem(BaseModel):
+    key: str
+    value: str
+    ttl: Optional[int] = Field(3600, gt=0, description="Expiration in seconds, null for no expiration")
+
+
+class CacheItems(BaseModel):
+    items: List[CacheItem]
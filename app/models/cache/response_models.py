@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+
+class CacheValues(BaseModel):
+    values: Dict[str, Optional[str]]
+
+
+class CacheWriteResult(BaseModel):
+    stored: int
+
+
+class CacheDeleteResult(BaseModel):
+    pattern: str
+    deleted: int
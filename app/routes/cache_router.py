@@ -0,0 +1,92 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from app.config.settings import CACHE_KEY_PREFIX
+from app.handlers.cache_handler import export_entries, import_entries
+from app.models.cache.request_models import CacheKeys, CacheItems
+from app.models.cache.response_models import CacheValues, CacheWriteResult, CacheDeleteResult
+from app.services.cache_keys import in_cache_keyspace, invalidation_pattern
+from app.services.redis_client import redis_client
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+def _resolve_pattern(pattern: Optional[str], namespace: Optional[str], version: Optional[str]) -> str:
+    """
+    An explicit pattern wins; otherwise match by namespace and/or schema version.
+    Patterns are confined to the versioned cache entries, so rate-limit counters
+    and planner indexes are never exported or deleted.
+    """
+    if pattern is None:
+        return invalidation_pattern(namespace, version)
+    if not in_cache_keyspace(pattern):
+        raise HTTPException(
+            status_code=400, detail=f"pattern must start with '{CACHE_KEY_PREFIX}:v'"
+        )
+    return pattern
+
+
+@router.post("/mget", response_model=CacheValues)
+async def get_many(request: CacheKeys):
+    """
+    Fetch several keys in one round trip. Missing keys map to null.
+    """
+    values = await redis_client.mget(request.keys)
+    return CacheValues(values=dict(zip(request.keys, values)))
+
+
+@router.post("/mset", response_model=CacheWriteResult)
+async def set_many(request: CacheItems):
+    """
+    Store several keys with per-item TTLs in one pipelined round trip.
+    """
+    stored = await redis_client.mset([(item.key, item.value, item.ttl) for item in request.items])
+    return CacheWriteResult(stored=stored)
+
+
+@router.get("/export")
+async def export_cache(
+    pattern: Optional[str] = None,
+    namespace: Optional[str] = None,
+    version: Optional[str] = None,
+):
+    """
+    Stream matching entries as NDJSON, walking the keyspace with SCAN.
+    """
+    return StreamingResponse(
+        export_entries(_resolve_pattern(pattern, namespace, version)),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/import", response_model=CacheWriteResult)
+async def import_cache(request: Request):
+    """
+    Load an NDJSON export (one {"key", "value", "ttl"} object per line) streamed in the request body.
+    """
+    try:
+        imported = await import_entries(request.stream())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return CacheWriteResult(stored=imported)
+
+
+@router.delete("", response_model=CacheDeleteResult)
+async def delete_cache(
+    pattern: Optional[str] = None,
+    namespace: Optional[str] = None,
+    version: Optional[str] = None,
+):
+    """
+    Delete every key matching a pattern, or a namespace and/or schema version.
+    At least one of them is required.
+    """
+    if pattern is None and namespace is None and version is None:
+        raise HTTPException(
+            status_code=400, detail="One of pattern, namespace or version is required"
+        )
+    resolved = _resolve_pattern(pattern, namespace, version)
+    deleted = await redis_client.delete_pattern(resolved)
+    return CacheDeleteResult(pattern=resolved, deleted=deleted)
@@ -0,0 +1,53 @@
+import asyncio
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+from app.services.redis_client import redis_client
+from app.services.http_client import check_upstream
+from app.services.admission import limiters
+from app.services import executor, query_planner, singleflight
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/healthz")
+async def healthz():
+    """
+    Liveness probe: the process is up and serving requests.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readyz(request: Request):
+    """
+    Readiness probe: startup warmup finished and both Redis and Google are reachable.
+    """
+    warmed_up = getattr(request.app.state, "warmed_up", False)
+    cache_ready, upstream_ready = await asyncio.gather(redis_client.ping(), check_upstream())
+    ready = warmed_up and cache_ready and upstream_ready
+
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "warmed_up": warmed_up,
+            "cache": cache_ready,
+            "upstream": upstream_ready,
+        },
+    )
+
+
+@router.get("/stats")
+async def stats():
+    """
+    Per-worker counters: admission control, upstream call deduplication,
+    text search reuse and normalization offload.
+    """
+    return {
+        "admission": {route: limiter.stats() for route, limiter in limiters.items()},
+        "deduplication": singleflight.stats,
+        "query_planner": query_planner.stats,
+        "normalization": executor.stats,
+    }
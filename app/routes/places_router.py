@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from typing import Optional
+
+from fastapi import APIRouter, WebSocket
 
 from app.handlers.fetch_places_handler import fetch_places
 from app.models.fetch_places.request_models import PlacesRequest
@@ -9,6 +11,7 @@ from app.models.get_photos.request_models import Photo_gRPC
 from app.models.get_photos.response_models import Photo
 
 from app.handlers.autocomplete_places_handler import autocomplete_places
+from app.handlers.autocomplete_session_handler import run_autocomplete_session
 from app.models.autocomplete_places.request_models import AutocompleteSearch
 from app.models.autocomplete_places.response_models import Suggestions_List
 from app.models.fetch_places.response_models import PlaceResponse
@@ -48,12 +51,21 @@ async def autocomplete_search(request: AutocompleteSearch):
     suggestions = await autocomplete_places(request)
     return Suggestions_List(suggestions_list=suggestions)
 
+
+@router.websocket("/autocomplete/ws")
+async def autocomplete_session(websocket: WebSocket):
+    """
+    Autocomplete over a WebSocket session: send {"input": "..."} per keystroke,
+    receive Suggestions_List payloads for the latest input only.
+    """
+    await run_autocomplete_session(websocket)
+
 @router.get("/{place_id}", response_model=GetPlaceResponse)
-async def get_place(place_id: str):
+async def get_place(place_id: str, sessionToken: Optional[str] = None):
     """
     Get a place using the GET method.
     """
-    place = await get_place_info(place_id)
+    place = await get_place_info(place_id, sessionToken)
     return place
 
 @router.post("/text-search", response_model=TextSearchResponse)
@@ -0,0 +1,159 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from app.config.settings import (
+    ADMISSION_MAX_CONCURRENCY,
+    ADMISSION_MAX_QUEUE,
+    ADMISSION_QUEUE_TIMEOUT,
+    ADMISSION_ROUTE_LIMITS,
+    RATE_LIMIT_PER_MINUTE,
+    RATE_LIMIT_TRUSTED_CLIENTS,
+    CACHE_KEY_PREFIX,
+)
+from app.services.redis_client import redis_client
+from app.services.logger import get_logger
+
+logger = get_logger(__name__)
+
+RATE_LIMIT_WINDOW = 60
+CLIENT_ID_HEADER = "X-Client-ID"
+# Only the API routes are rate limited; health checks and docs are not
+RATE_LIMITED_PREFIXES = ("/places", "/search")
+
+
+class Overloaded(Exception):
+    """Raised when a request cannot get an upstream slot in time."""
+
+    def __init__(self, route: str, retry_after: int):
+        super().__init__(f"Upstream capacity exceeded for {route}")
+        self.route = route
+        self.retry_after = retry_after
+
+
+class AdmissionLimiter:
+    """
+    Bounds concurrent upstream calls for one route.
+    Up to `max_concurrency` calls run at once, up to `max_queue` more wait
+    at most `queue_timeout` seconds; anything beyond that is rejected.
+    """
+
+    def __init__(self, route: str, max_concurrency: int, max_queue: int, queue_timeout: float):
+        self.route = route
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.waiting = 0
+        self.rejected = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @property
+    def active(self) -> int:
+        return self.max_concurrency - self._semaphore._value
+
+    def _reject(self):
+        self.rejected += 1
+        logger.warning(
+            "Rejecting %s request (active=%d, waiting=%d)", self.route, self.active, self.waiting
+        )
+        raise Overloaded(self.route, max(1, math.ceil(self.queue_timeout)))
+
+    @asynccontextmanager
+    async def slot(self):
+        if not self._semaphore.locked():
+            # A free slot is taken without suspending
+            await self._semaphore.acquire()
+        else:
+            if self.waiting >= self.max_queue:
+                self._reject()
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._reject()
+            finally:
+                self.waiting -= 1
+
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+        }
+
+
+def _parse_route_limits(value: str) -> dict[str, int]:
+    limits = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        route, _, limit = item.partition("=")
+        limits[route.strip()] = int(limit)
+    return limits
+
+
+_route_limits = _parse_route_limits(ADMISSION_ROUTE_LIMITS)
+limiters: dict[str, AdmissionLimiter] = {}
+
+
+def get_limiter(route: str) -> AdmissionLimiter:
+    if route not in limiters:
+        limiters[route] = AdmissionLimiter(
+            route,
+            _route_limits.get(route, ADMISSION_MAX_CONCURRENCY),
+            ADMISSION_MAX_QUEUE,
+            ADMISSION_QUEUE_TIMEOUT,
+        )
+    return limiters[route]
+
+
+def upstream_slot(route: str):
+    """Acquire an upstream call slot for `route`; raises Overloaded when over capacity."""
+    return get_limiter(route).slot()
+
+
+async def overloaded_handler(request: Request, exc: Overloaded):
+    return JSONResponse(
+        status_code=503,
+        content={"error": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def rate_limit_middleware(request: Request, call_next):
+    """
+    Fixed-window per-client rate limit shared by all workers through Redis.
+    Clients are identified by their peer address. The server resolves it from
+    X-Forwarded-For only for proxies listed in FORWARDED_ALLOW_IPS. X-Client-ID is
+    only honoured from peers in RATE_LIMIT_TRUSTED_CLIENTS, since any caller
+    could otherwise pick a fresh ID per request.
+    Fails open if Redis is unavailable.
+    """
+    if RATE_LIMIT_PER_MINUTE <= 0 or not request.url.path.startswith(RATE_LIMITED_PREFIXES):
+        return await call_next(request)
+
+    client_id = request.client.host if request.client else "unknown"
+    if client_id in RATE_LIMIT_TRUSTED_CLIENTS:
+        client_id = request.headers.get(CLIENT_ID_HEADER) or client_id
+    now = time.time()
+    window = int(now // RATE_LIMIT_WINDOW)
+    key = f"{CACHE_KEY_PREFIX}:ratelimit:{client_id}:{window}"
+
+    count = await redis_client.incr_window(key, RATE_LIMIT_WINDOW)
+    if count is not None and count > RATE_LIMIT_PER_MINUTE:
+        retry_after = max(1, math.ceil((window + 1) * RATE_LIMIT_WINDOW - now))
+        return JSONResponse(
+            status_code=429,
+            content={"error": "Rate limit exceeded"},
+            headers={"Retry-After": str(retry_after)},
+        )
+    return await call_next(request)
@@ -0,0 +1,92 @@
+import hashlib
+import re
+import unicodedata
+
+from app.config.settings import CACHE_KEY_PREFIX, CACHE_SCHEMA_VERSION_OVERRIDE
+
+# Shape version of the cached normalized responses. Bump it in the same change
+# that alters normalize_google_response, normalize_place_response or any cached
+# model, so entries written by older deploys are never served.
+SCHEMA_VERSION = "1"
+CACHE_SCHEMA_VERSION = CACHE_SCHEMA_VERSION_OVERRIDE or SCHEMA_VERSION
+
+# Namespaces of the cached upstream responses
+PLACES = "places"
+TEXT_SEARCH = "text_search"
+AUTOCOMPLETE = "autocomplete"
+PLACE_INFO = "place_info"
+PHOTO = "photo"
+COORDINATES = "coordinates"
+
+# 5 decimal places is ~1.1m, well below any search radius we accept
+COORDINATE_PRECISION = 5
+# Keys whose parameter part is longer than this are hashed
+MAX_PARAMS_LENGTH = 128
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Case-fold, Unicode-normalize and collapse whitespace in free text."""
+    text = unicodedata.normalize("NFKC", text)
+    return _WHITESPACE.sub(" ", text).strip().casefold()
+
+
+def _canonical(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        value = round(value, COORDINATE_PRECISION)
+        # Avoid "-0.0" and trailing zeros so equal coordinates share a key
+        return f"{value + 0.0:.{COORDINATE_PRECISION}f}".rstrip("0").rstrip(".")
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str):
+        return normalize_text(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ",".join(sorted({_canonical(item) for item in value}))
+    raise TypeError(f"Unsupported cache key parameter type: {type(value).__name__}")
+
+
+def namespace_prefix(namespace: str, version: str = CACHE_SCHEMA_VERSION) -> str:
+    return f"{CACHE_KEY_PREFIX}:v{version}:{namespace}:"
+
+
+def build_cache_key(namespace: str, *identifiers: str, **params) -> str:
+    """
+    Build a canonical, versioned cache key.
+    Identifiers (place IDs, photo references) are kept verbatim since they are
+    case-sensitive; keyword parameters are canonicalized: text is normalized,
+    floats rounded, collections sorted and de-duplicated.
+    Long parameter sets are replaced by a hash to keep keys bounded.
+    """
+    parts = list(identifiers)
+    if params:
+        canonical = "&".join(
+            f"{name}={_canonical(value)}" for name, value in sorted(params.items())
+        )
+        if len(canonical) > MAX_PARAMS_LENGTH:
+            canonical = "h=" + hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+        parts.append(canonical)
+    return namespace_prefix(namespace) + ":".join(parts)
+
+
+def nearby_index_key(place_type: str) -> str:
+    """
+    Geo index (a ZSET) of cached nearby searches for one place type.
+    Kept outside the versioned string keyspace so cache export and
+    invalidation patterns never match it; it still tracks the schema version.
+    """
+    return f"{CACHE_KEY_PREFIX}:index:v{CACHE_SCHEMA_VERSION}:nearby:{place_type}"
+
+
+def in_cache_keyspace(pattern: str) -> bool:
+    """Whether a MATCH pattern is confined to the versioned cache entries."""
+    return pattern.startswith(f"{CACHE_KEY_PREFIX}:v")
+
+
+def invalidation_pattern(namespace: str | None = None, version: str | None = None) -> str:
+    """Redis MATCH pattern covering a namespace and/or schema version (all when omitted)."""
+    return f"{CACHE_KEY_PREFIX}:v{version or '*'}:{namespace or '*'}:*"
@@ -0,0 +1,121 @@
+import gzip
+import hashlib
+from collections import OrderedDict
+
+from fastapi import Request, Response
+
+from app.config.settings import COMPRESSION_MIN_SIZE, COMPRESSION_CACHE_SIZE
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is listed in requirements.txt
+    brotli = None
+
+# JSON endpoints whose responses get ETags and compression
+CONDITIONAL_PREFIXES = ("/places", "/search")
+
+# (body hash, encoding) -> compressed body, least recently used first
+_compressed: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+
+# Content codings we produce; each gets its own ETag suffix
+ENCODINGS = ("br", "gzip")
+
+
+def body_hash(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def make_etag(digest: str, encoding: str | None = None) -> str:
+    """
+    Strong ETag for one representation. Strong validators must differ per
+    content coding (RFC 9110 8.8.3), so compressed bodies get a suffix.
+    """
+    return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str, digest: str) -> bool:
+    """
+    If-None-Match uses weak comparison, so any representation of the same
+    content matches: W/ prefixes and encoding suffixes are ignored.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        opaque = tag.strip().removeprefix("W/").strip('"')
+        for encoding in ENCODINGS:
+            opaque = opaque.removesuffix(f"-{encoding}")
+        if opaque == digest:
+            return True
+    return False
+
+
+def _pick_encoding(accept_encoding: str) -> str | None:
+    accepted = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        accepted.add(name.strip().lower())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, digest: str, encoding: str) -> bytes:
+    """Compress once per distinct body and encoding; repeats are served from memory."""
+    cache_key = (digest, encoding)
+    if cache_key in _compressed:
+        _compressed.move_to_end(cache_key)
+        return _compressed[cache_key]
+
+    if encoding == "br":
+        compressed = brotli.compress(body, quality=5)
+    else:
+        compressed = gzip.compress(body, compresslevel=6)
+
+    _compressed[cache_key] = compressed
+    if len(_compressed) > COMPRESSION_CACHE_SIZE:
+        _compressed.popitem(last=False)
+    return compressed
+
+
+async def conditional_response_middleware(request: Request, call_next):
+    """
+    Add a strong, per-encoding ETag to successful JSON responses, answer matching
+    If-None-Match with 304, and compress bodies above COMPRESSION_MIN_SIZE
+    with brotli or gzip.
+    """
+    response = await call_next(request)
+    if (
+        response.status_code != 200
+        or not request.url.path.startswith(CONDITIONAL_PREFIXES)
+        or not response.headers.get("content-type", "").startswith("application/json")
+    ):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    digest = body_hash(body)
+    encoding = _pick_encoding(request.headers.get("accept-encoding", ""))
+    if len(body) < COMPRESSION_MIN_SIZE:
+        encoding = None
+    headers = {
+        key: value
+        for key, value in response.headers.items()
+        if key.lower() not in ("content-length", "content-encoding")
+    }
+    headers["etag"] = make_etag(digest, encoding)
+    headers["vary"] = ", ".join(filter(None, [headers.get("vary"), "Accept-Encoding"]))
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, digest):
+        headers.pop("content-type", None)
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        body = _compress(body, digest, encoding)
+        headers["content-encoding"] = encoding
+
+    return Response(content=body, status_code=200, headers=headers)
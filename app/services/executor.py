@@ -0,0 +1,95 @@
+import asyncio
+import multiprocessing
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable
+
+from app.config.settings import (
+    NORMALIZE_EXECUTOR,
+    NORMALIZE_OFFLOAD_MIN_BYTES,
+    NORMALIZE_MAX_WORKERS,
+    NORMALIZE_MAX_PENDING,
+)
+from app.services.logger import get_logger
+
+logger = get_logger(__name__)
+
+_executor: Executor | None = None
+_slots: asyncio.Semaphore | None = None
+
+# Normalization jobs run inline vs offloaded, reported by /stats
+stats = {
+    "inline": 0,
+    "offloaded": 0,
+    "pending": 0,
+    "waiting": 0,
+    "offload_seconds": 0.0,
+}
+
+
+def _executor_kind() -> str:
+    if NORMALIZE_EXECUTOR != "auto":
+        return NORMALIZE_EXECUTOR
+    # Threads run Python code in parallel on free-threaded builds, without pickling
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return "process" if gil_enabled else "thread"
+
+
+def get_executor() -> Executor | None:
+    """Create the normalization pool on first use; None when offloading is disabled."""
+    global _executor
+    kind = _executor_kind()
+    if kind == "off":
+        return None
+    if _executor is None:
+        if kind == "thread":
+            _executor = ThreadPoolExecutor(NORMALIZE_MAX_WORKERS, thread_name_prefix="normalize")
+        else:
+            # spawn: forking a process that runs an event loop and logging threads is unsafe
+            _executor = ProcessPoolExecutor(
+                NORMALIZE_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        logger.info("Started %s normalization pool with %d workers", kind, NORMALIZE_MAX_WORKERS)
+    return _executor
+
+
+def shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def run_normalization(func: Callable, payload, size: int):
+    """
+    Run `func(payload)` inline for small payloads, or in the pool once `size`
+    (in bytes) reaches NORMALIZE_OFFLOAD_MIN_BYTES so the event loop keeps serving
+    other requests. At most NORMALIZE_MAX_PENDING jobs are in flight; later
+    ones wait for a slot. `func` must be a module-level function and should
+    return something cheap to transfer, such as a JSON string.
+    """
+    global _slots
+    executor = get_executor() if size >= NORMALIZE_OFFLOAD_MIN_BYTES else None
+    if executor is None:
+        stats["inline"] += 1
+        return func(payload)
+
+    if _slots is None:
+        _slots = asyncio.Semaphore(NORMALIZE_MAX_PENDING)
+
+    stats["waiting"] += 1
+    try:
+        await _slots.acquire()
+    finally:
+        stats["waiting"] -= 1
+
+    stats["pending"] += 1
+    start = time.perf_counter()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, func, payload)
+    finally:
+        _slots.release()
+        stats["pending"] -= 1
+        stats["offloaded"] += 1
+        stats["offload_seconds"] += time.perf_counter() - start
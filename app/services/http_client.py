@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import httpx
+
+from app.config.settings import (
+    GOOGLE_PLACES_API_URL,
+    HTTP_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    UPSTREAM_PROBE_TTL,
+)
+from app.services.logger import get_logger
+
+logger = get_logger(__name__)
+
+_client: httpx.AsyncClient | None = None
+# (timestamp, reachable) of the last upstream probe
+_last_probe: tuple[float, bool] = (0.0, False)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client.
+    Sharing one client keeps upstream TCP/TLS connections alive between requests.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _probe_upstream() -> bool:
+    """Any HTTP response means the upstream is reachable; only transport errors count as down."""
+    try:
+        await get_http_client().get(GOOGLE_PLACES_API_URL, timeout=min(HTTP_TIMEOUT, 5))
+    except httpx.HTTPError as e:
+        logger.warning("Upstream probe failed: %s", e)
+        return False
+    return True
+
+
+async def check_upstream() -> bool:
+    """Report upstream reachability, reusing a recent probe result."""
+    global _last_probe
+    checked_at, reachable = _last_probe
+    if time.monotonic() - checked_at < UPSTREAM_PROBE_TTL:
+        return reachable
+    reachable = await _probe_upstream()
+    _last_probe = (time.monotonic(), reachable)
+    return reachable
+
+
+async def warmup(connections: int) -> bool:
+    """Open `connections` pooled connections to the upstream before serving traffic."""
+    global _last_probe
+    results = await asyncio.gather(*(_probe_upstream() for _ in range(connections)))
+    reachable = any(results)
+    _last_probe = (time.monotonic(), reachable)
+    return reachable
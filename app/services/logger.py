@@ -0,0 +1,144 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import time
+import uuid
+from contextvars import ContextVar
+
+from app.config.settings import LOG_LEVEL, LOG_FORMAT, LOG_PAYLOAD_SAMPLE_RATE
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Request ID of the request currently being handled (set by the middleware)
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+_listener: logging.handlers.QueueListener | None = None
+
+access_logger = logging.getLogger("app.access")
+
+
+class RequestIdFilter(logging.Filter):
+    """Attach the current request ID to every log record."""
+
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Render log records as single-line JSON objects."""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        extra = getattr(record, "data", None)
+        if extra is not None:
+            entry["data"] = extra
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Render log records as plain text, appending the payload if present."""
+
+    def __init__(self):
+        super().__init__(
+            "%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"
+        )
+
+    def format(self, record):
+        line = super().format(record)
+        extra = getattr(record, "data", None)
+        if extra is not None:
+            line = f"{line} data={json.dumps(extra, default=str)}"
+        return line
+
+
+def setup_logging():
+    """
+    Configure the "app" logger hierarchy.
+    Records are pushed onto an in-memory queue and written to stdout by a
+    background thread, so the event loop never blocks on I/O.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    if LOG_FORMAT == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = TextFormatter()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Resolve the request ID on the calling task, not on the listener thread
+    queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger("app")
+    root.setLevel(LOG_LEVEL)
+    root.handlers = [queue_handler]
+    root.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a logger inside the "app" hierarchy."""
+    if not name.startswith("app"):
+        name = f"app.{name}"
+    return logging.getLogger(name)
+
+
+def log_payload(logger: logging.Logger, message: str, payload):
+    """
+    Log a raw upstream payload at DEBUG level for a sampled fraction of calls.
+    The payload is only serialized when the record is actually emitted; pass a
+    callable to defer producing it (e.g. parsing a response body) as well.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if random.random() >= LOG_PAYLOAD_SAMPLE_RATE:
+        return
+    if callable(payload):
+        payload = payload()
+    logger.debug(message, extra={"data": payload})
+
+
+async def request_id_middleware(request, call_next):
+    """
+    Propagate or generate a request ID, echo it in the response headers and
+    write one access line per request (method, path, status, duration).
+    """
+    request_id = request.headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex
+    token = request_id_var.set(request_id)
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        duration_ms = (time.perf_counter() - started) * 1000
+        access_logger.info(
+            "%s %s %d %.1fms",
+            request.method,
+            request.url.path,
+            status,
+            duration_ms,
+        )
+        request_id_var.reset(token)
+    response.headers[REQUEST_ID_HEADER] = request_id
+    return response
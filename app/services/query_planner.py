@@ -0,0 +1,235 @@
+import json
+import math
+import re
+
+from app.config.settings import QUERY_PLANNER_ENABLED
+from app.services.cache_keys import nearby_index_key, normalize_text
+from app.services.redis_client import redis_client
+from app.services.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Largest radius searchNearby accepts, so no covering result set can be further away
+MAX_NEARBY_RADIUS = 50000
+EARTH_RADIUS_M = 6371000
+# searchNearby returns at most this many places (no maxResultCount is sent); a
+# result set of this size may have been capped and is not complete for its circle
+NEARBY_RESULT_LIMIT = 20
+# A capped result set is only reused for a query whose center and radius are
+# within this fraction of the query radius of the cached search
+CAPPED_MATCH_TOLERANCE = 0.1
+# Nearest index members inspected per place type
+MAX_CANDIDATES = 16
+
+# Common text query terms and the place types a nearby search would use for them
+QUERY_TYPES = {
+    "coffee": ["cafe", "coffee_shop"],
+    "coffee shop": ["cafe", "coffee_shop"],
+    "cafe": ["cafe", "coffee_shop"],
+    "café": ["cafe", "coffee_shop"],
+    "restaurant": ["restaurant"],
+    "bar": ["bar"],
+    "pub": ["pub", "bar"],
+    "bakery": ["bakery"],
+    "pizza": ["pizza_restaurant"],
+    "pizzeria": ["pizza_restaurant"],
+    "sushi": ["sushi_restaurant"],
+    "ice cream": ["ice_cream_shop"],
+    "pharmacy": ["pharmacy", "drugstore"],
+    "supermarket": ["supermarket", "grocery_store"],
+    "grocery": ["grocery_store", "supermarket"],
+    "hotel": ["hotel", "lodging"],
+    "hostel": ["hostel", "lodging"],
+    "museum": ["museum"],
+    "park": ["park"],
+    "gym": ["gym", "fitness_center"],
+    "atm": ["atm"],
+    "bank": ["bank"],
+    "gas station": ["gas_station"],
+    "parking": ["parking"],
+    "hospital": ["hospital"],
+    "library": ["library"],
+    "cinema": ["movie_theater"],
+    "movie theater": ["movie_theater"],
+}
+
+# Words that qualify a query without naming a place
+_FILLER_WORDS = {"a", "an", "the", "some", "best", "good", "top", "cheap", "nice", "for", "to"}
+
+# Phrases that only restate the search area, e.g. "coffee near me"
+_HERE_PHRASE = re.compile(r"\b(?:near me|near here|nearby|around here|around me|close by)\b")
+
+# Anything a cached nearby result cannot answer: other locations ("in Lisbon",
+# "near the station"), which searchText honours despite locationBias, and
+# opening-hours qualifiers ("open now"), since cached results may be stale
+_UNSUPPORTED = re.compile(r"\b(?:in|near|around|at|close to|open|now|tonight|today)\b")
+
+# Reuse decisions, reported by /stats
+stats = {
+    "reused": 0,
+    "no_type_match": 0,
+    "unsupported_query": 0,
+    "no_covering_set": 0,
+    "empty_after_filter": 0,
+}
+
+
+def parse_query(query: str) -> tuple[list[str], list[str]] | None:
+    """
+    Split a text query into the place types it maps to and the remaining
+    words, which must then match place names. Returns None if no term maps.
+    Callers must check is_reusable_query() first.
+    """
+    words = _HERE_PHRASE.sub(" ", normalize_text(query)).split()
+
+    # Prefer the longest matching phrase ("coffee shop" over "coffee")
+    for size in (2, 1):
+        for i in range(len(words) - size + 1):
+            phrase = " ".join(words[i : i + size])
+            types = QUERY_TYPES.get(phrase) or (
+                QUERY_TYPES.get(phrase[:-1]) if phrase.endswith("s") else None
+            )
+            if types:
+                rest = words[:i] + words[i + size :]
+                return types, [word for word in rest if word not in _FILLER_WORDS]
+    return None
+
+
+def is_reusable_query(query: str) -> bool:
+    """
+    True unless the query names another location or asks for opening hours;
+    "near me" style phrases are fine since they restate the search area.
+    """
+    text = _HERE_PHRASE.sub(" ", normalize_text(query))
+    return _UNSUPPORTED.search(text) is None
+
+
+def distance_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+async def register_nearby_result(
+    cache_key: str,
+    latitude: float,
+    longitude: float,
+    radius: int,
+    included_types: list[str],
+    result_count: int,
+):
+    """
+    Index a cached nearby search by center and type so text searches can find it.
+    The member records the radius and how many places Google returned.
+    """
+    member = f"{radius}|{result_count}|{cache_key}"
+    for place_type in set(included_types):
+        index_key = nearby_index_key(place_type)
+        await redis_client.geo_add(index_key, longitude, latitude, member)
+
+
+def _covers(distance: float, cached_radius: int, result_count: int, radius: int, filtered: bool) -> bool:
+    """
+    Whether a cached nearby search answers a query circle completely.
+    A result set below Google's cap holds every matching place in its circle,
+    so any circle it contains can be answered from it. A capped set is only the
+    top places of its own circle: it is reused just for the same circle (within
+    CAPPED_MATCH_TOLERANCE) and never for keyword-filtered queries, which
+    would only see the places that happened to make the cut.
+    """
+    if result_count < NEARBY_RESULT_LIMIT:
+        return distance + radius <= cached_radius
+    if filtered:
+        return False
+    tolerance = radius * CAPPED_MATCH_TOLERANCE
+    return distance <= tolerance and abs(cached_radius - radius) <= tolerance
+
+
+async def _find_covering_result(
+    types: list[str], latitude: float, longitude: float, radius: int, filtered: bool
+):
+    """
+    Return cached places from a nearby search that completely answers the
+    requested circle (see _covers). Only the nearest MAX_CANDIDATES index
+    members per type are inspected, and their entries are fetched in one round trip.
+    """
+    for place_type in types:
+        index_key = nearby_index_key(place_type)
+        candidates = await redis_client.geo_search(
+            index_key, longitude, latitude, MAX_NEARBY_RADIUS, count=MAX_CANDIDATES
+        )
+        covering = []
+        malformed = []
+        for member, distance in candidates:
+            try:
+                cached_radius, result_count, cache_key = member.split("|", 2)
+                cached_radius, result_count = int(cached_radius), int(result_count)
+            except ValueError:
+                malformed.append(member)
+                continue
+            if _covers(distance, cached_radius, result_count, radius, filtered):
+                covering.append((member, cache_key))
+        if malformed:
+            await redis_client.geo_remove(index_key, *malformed)
+        if not covering:
+            continue
+
+        values = await redis_client.mget([cache_key for _, cache_key in covering])
+        # Drop members whose nearby result expired
+        expired = [member for (member, _), cached in zip(covering, values) if cached is None]
+        if expired:
+            await redis_client.geo_remove(index_key, *expired)
+        for (_, cache_key), cached in zip(covering, values):
+            if cached is not None:
+                return cache_key, json.loads(cached)
+    return None
+
+
+async def plan_text_search(query: str, latitude: float, longitude: float, radius: int):
+    """
+    Try to answer a text search from a cached nearby search.
+    Returns the filtered places, or None when searchText has to be called.
+    """
+    if not QUERY_PLANNER_ENABLED:
+        return None
+
+    if not is_reusable_query(query):
+        stats["unsupported_query"] += 1
+        logger.debug("Query %r needs searchText", query)
+        return None
+
+    parsed = parse_query(query)
+    if parsed is None:
+        stats["no_type_match"] += 1
+        return None
+    types, name_words = parsed
+
+    covering = await _find_covering_result(types, latitude, longitude, radius, bool(name_words))
+    if covering is None:
+        stats["no_covering_set"] += 1
+        logger.debug("No covering nearby result for %r", query)
+        return None
+    cache_key, places = covering
+
+    wanted_types = set(types)
+    matches = [
+        place
+        for place in places
+        if wanted_types & set(place.get("types") or [])
+        and all(word in normalize_text(place.get("name") or "") for word in name_words)
+        and distance_m(
+            latitude, longitude, place["location"]["latitude"], place["location"]["longitude"]
+        )
+        <= radius
+    ]
+    if not matches:
+        stats["empty_after_filter"] += 1
+        logger.info("Covering nearby result %s has no match for %r", cache_key, query)
+        return None
+
+    stats["reused"] += 1
+    logger.info("Answered text search %r from nearby result %s", query, cache_key)
+    return matches
@@ -1,13 +1,32 @@
-import redis.asyncio as redis
+import asyncio
 import os
 
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
 REDIS_HOST = os.getenv("REDIS_HOST", "places_wrapper_cache")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
 
 class RedisClient:
     def __init__(self):
+        # Creating the client does no I/O; connections are opened on first use or in warmup()
         self.redis = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
 
+    async def ping(self, timeout: float = 1.0) -> bool:
+        """Check that Redis is reachable within `timeout` seconds."""
+        try:
+            return await asyncio.wait_for(self.redis.ping(), timeout)
+        except (RedisError, asyncio.TimeoutError):
+            return False
+
+    async def warmup(self, connections: int) -> bool:
+        """Open `connections` pooled connections by pinging concurrently."""
+        results = await asyncio.gather(*(self.ping() for _ in range(connections)))
+        return all(results)
+
+    async def close(self):
+        await self.redis.aclose()
+
     async def set(self, key: str, value: str, expire: int = 3600):
         """Set a key-value pair in Redis with an expiration time."""
         await self.redis.set(key, value, ex=expire)
@@ -20,4 +39,94 @@ class RedisClient:
         """Delete a key from Redis."""
         await self.redis.delete(key)
 
+    async def incr_window(self, key: str, expire: int) -> int | None:
+        """Increment a counter that expires after `expire` seconds. Returns None if Redis is down."""
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                count, _ = await pipe.incr(key).expire(key, expire, nx=True).execute()
+        except RedisError:
+            return None
+        return count
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """Retrieve several values in one round trip."""
+        if not keys:
+            return []
+        return await self.redis.mget(keys)
+
+    async def mset(self, items: list[tuple[str, str, int | None]]) -> int:
+        """Store (key, value, expire) triples in one pipelined round trip; expire None keeps no TTL."""
+        if not items:
+            return 0
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, value, expire in items:
+                pipe.set(key, value, ex=expire)
+            await pipe.execute()
+        return len(items)
+
+    async def scan_entries(self, pattern: str, batch_size: int = 500):
+        """
+        Iterate (key, value, ttl) for every key matching a pattern.
+        Keys are walked with SCAN and fetched in pipelined batches; ttl is None for keys without expiry.
+        Only string keys are returned since other types (such as geo indexes) cannot be read with GET.
+        """
+        batch = []
+        async for key in self.redis.scan_iter(match=pattern, count=batch_size, _type="string"):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                async for entry in self._fetch_entries(batch):
+                    yield entry
+                batch = []
+        if batch:
+            async for entry in self._fetch_entries(batch):
+                yield entry
+
+    async def _fetch_entries(self, keys: list[str]):
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(key).ttl(key)
+            results = await pipe.execute()
+        for i, key in enumerate(keys):
+            value, ttl = results[2 * i], results[2 * i + 1]
+            # Skip keys that expired between SCAN and GET
+            if value is not None:
+                yield key, value, ttl if ttl > 0 else None
+
+    async def geo_add(self, key: str, longitude: float, latitude: float, member: str, expire: int = 3600):
+        """Add a member to a geo index and refresh the index expiration."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.geoadd(key, [longitude, latitude, member]).expire(key, expire)
+            await pipe.execute()
+
+    async def geo_search(
+        self, key: str, longitude: float, latitude: float, radius: float, count: int | None = None
+    ):
+        """Return up to `count` (member, distance in meters) pairs within `radius` meters, nearest first."""
+        return await self.redis.geosearch(
+            key,
+            longitude=longitude,
+            latitude=latitude,
+            radius=radius,
+            unit="m",
+            withdist=True,
+            sort="ASC",
+            count=count,
+        )
+
+    async def geo_remove(self, key: str, *members: str):
+        await self.redis.zrem(key, *members)
+
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Delete every key matching a pattern using SCAN, in batches. Returns the number deleted."""
+        deleted = 0
+        batch = []
+        async for key in self.redis.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await self.redis.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await self.redis.unlink(*batch)
+        return deleted
+
 redis_client = RedisClient()
@@ -0,0 +1,23 @@
+import asyncio
+from typing import Awaitable, Callable
+
+_in_flight: dict[str, asyncio.Task] = {}
+
+# Calls answered by joining an identical in-flight call instead of going upstream
+stats = {"deduplicated": 0}
+
+
+async def singleflight(key: str, factory: Callable[[], Awaitable]):
+    """
+    Run `factory()` once per key at a time; concurrent callers with the same
+    key await the same result instead of issuing duplicate upstream calls.
+    """
+    task = _in_flight.get(key)
+    if task is not None:
+        stats["deduplicated"] += 1
+    else:
+        task = asyncio.ensure_future(factory())
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+    # Shield so one caller disconnecting does not cancel the call for the others
+    return await asyncio.shield(task)
@@ -0,0 +1,138 @@
+"""
+Google Places API responses used by the mock server and the micro-benchmarks.
+
+If MOCK_FIXTURES_DIR points at a directory containing recorded responses
+(searchNearby.json, searchText.json, place.json, photo.json,
+autocomplete.json, geocode.json) those are replayed verbatim, otherwise a
+synthetic payload with the same shape is generated.
+"""
+import json
+import os
+from pathlib import Path
+
+FIXTURES_DIR = os.getenv("MOCK_FIXTURES_DIR")
+
+
+def _load(name: str):
+    if not FIXTURES_DIR:
+        return None
+    path = Path(FIXTURES_DIR) / f"{name}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def make_place(index: int, latitude: float = 41.1579, longitude: float = -8.6291):
+    """Build a single place in the Places API (New) format."""
+    place_id = f"ChIJmock{index:06d}"
+    return {
+        "id": place_id,
+        "displayName": {"text": f"Mock Place {index}", "languageCode": "en"},
+        "location": {
+            "latitude": latitude + index * 0.0001,
+            "longitude": longitude - index * 0.0001,
+        },
+        "rating": 3.5 + (index % 15) / 10,
+        "userRatingCount": 10 + index,
+        "types": ["cafe", "food", "point_of_interest", "establishment"],
+        "formattedAddress": f"Rua Mock {index}, 4000-000 Porto, Portugal",
+        "priceLevel": "PRICE_LEVEL_MODERATE",
+        "priceRange": {
+            "startPrice": {"currencyCode": "EUR", "units": "10"},
+            "endPrice": {"currencyCode": "EUR", "units": "20"},
+        },
+        "nationalPhoneNumber": "222 000 000",
+        "internationalPhoneNumber": "+351 222 000 000",
+        "currentOpeningHours": {
+            "openNow": True,
+            "periods": [
+                {
+                    "open": {"day": day, "hour": 8, "minute": 0},
+                    "close": {"day": day, "hour": 20, "minute": 0},
+                }
+                for day in range(7)
+            ],
+        },
+        "regularOpeningHours": {"openNow": True, "periods": []},
+        "photos": [
+            {
+                "name": f"places/{place_id}/photos/photo{n}",
+                "widthPx": 4032,
+                "heightPx": 3024,
+                "googleMapsUri": f"https://maps.google.com/maps/contrib/{n}",
+            }
+            for n in range(10)
+        ],
+        "accessibilityOptions": {
+            "wheelchairAccessibleParking": True,
+            "wheelchairAccessibleEntrance": True,
+        },
+        "allowsDogs": index % 2 == 0,
+        "goodForChildren": True,
+        "goodForGroups": index % 3 == 0,
+        "editorialSummary": {"overview": "A mock place used for benchmarking."},
+        "reviews": [
+            {
+                "authorAttribution": {"displayName": f"Reviewer {n}"},
+                "rating": 4,
+                "text": {"text": "Great coffee and friendly staff. " * 5},
+                "relativePublishTimeDescription": "a month ago",
+            }
+            for n in range(5)
+        ],
+    }
+
+
+def search_nearby(count: int = 20):
+    return _load("searchNearby") or {"places": [make_place(i) for i in range(count)]}
+
+
+def search_text(count: int = 20):
+    return _load("searchText") or {"places": [make_place(i) for i in range(count)]}
+
+
+def place_details(place_id: str = "ChIJmock000000"):
+    recorded = _load("place")
+    if recorded:
+        return recorded
+    place = make_place(0)
+    place["id"] = place_id
+    return place
+
+
+def photo_media(photo_name: str):
+    return _load("photo") or {
+        "name": photo_name,
+        "photoUri": f"https://lh3.googleusercontent.com/mock/{photo_name.rsplit('/', 1)[-1]}",
+    }
+
+
+def autocomplete(text: str, count: int = 5):
+    return _load("autocomplete") or {
+        "suggestions": [
+            {
+                "placePrediction": {
+                    "placeId": f"ChIJmock{i:06d}",
+                    "text": {"text": f"{text} {i}, Porto, Portugal"},
+                    "structuredFormat": {
+                        "mainText": {"text": f"{text} {i}"},
+                        "secondaryText": {"text": "Porto, Portugal"},
+                    },
+                }
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def geocode(address: str):
+    return _load("geocode") or {
+        "status": "OK",
+        "results": [
+            {
+                "formatted_address": address,
+                "place_id": "ChIJmockgeocode",
+                "geometry": {"location": {"lat": 41.1579, "lng": -8.6291}},
+            }
+        ],
+    }
@@ -0,0 +1,155 @@
+"""
+End-to-end load scenarios against a running Place Wrapper instance.
+
+Start the mock upstream and the service (see bench/mock_google.py), then:
+
+    python -m bench.load --base-url http://localhost:8080 --requests 500 --concurrency 50
+
+Scenarios, run for every router endpoint:
+    hot   - the same request repeatedly (measures the cache-hit path)
+    cold  - a unique request every time (measures the upstream path)
+    burst - all requests fired at once with no concurrency limit
+"""
+import asyncio
+import itertools
+import time
+import uuid
+
+import httpx
+import typer
+
+from bench.stats import summarize, write_results
+
+cli = typer.Typer()
+
+_counter = itertools.count(1)
+
+
+def _unique() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def _offset() -> float:
+    return next(_counter) * 0.00001
+
+
+# endpoint name -> (method, path builder, body builder); builders take a "cold" flag
+ENDPOINTS = {
+    "places": (
+        "POST",
+        lambda cold: "/places/",
+        lambda cold: {
+            "location": {"latitude": 41.1579 + (_offset() if cold else 0), "longitude": -8.6291},
+            "radius": 1000,
+            "includedTypes": ["cafe"],
+        },
+    ),
+    "text_search": (
+        "POST",
+        lambda cold: "/places/text-search",
+        lambda cold: {
+            "query": f"coffee {_unique()}" if cold else "coffee",
+            "radius": 1000,
+            "location": {"latitude": 41.1579, "longitude": -8.6291},
+        },
+    ),
+    "autocomplete": (
+        "POST",
+        lambda cold: "/places/autocomplete",
+        lambda cold: {"input": f"cafe {_unique()}" if cold else "cafe"},
+    ),
+    "photo": (
+        "POST",
+        lambda cold: "/places/photo",
+        lambda cold: {
+            "gRPC": f"places/ChIJmock000000/photos/{_unique() if cold else 'photo0'}"
+        },
+    ),
+    "place_details": (
+        "GET",
+        lambda cold: f"/places/ChIJmock{_unique() if cold else '000000'}",
+        lambda cold: None,
+    ),
+    "search_coordinates": (
+        "POST",
+        lambda cold: "/search/",
+        lambda cold: {"place_name": f"Porto {_unique()}" if cold else "Porto"},
+    ),
+}
+
+
+async def _send(client: httpx.AsyncClient, endpoint: str, cold: bool):
+    method, path, body = ENDPOINTS[endpoint]
+    t0 = time.perf_counter()
+    response = await client.request(method, path(cold), json=body(cold))
+    return time.perf_counter() - t0, response.status_code < 400
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, endpoint: str, scenario: str, requests: int, concurrency: int
+):
+    cold = scenario == "cold"
+    limit = asyncio.Semaphore(requests if scenario == "burst" else concurrency)
+    latencies = []
+    errors = 0
+
+    if scenario == "hot":
+        # Prime the cache so every measured request is a hit
+        await _send(client, endpoint, cold=False)
+
+    async def worker():
+        nonlocal errors
+        async with limit:
+            try:
+                latency, ok = await _send(client, endpoint, cold)
+            except httpx.HTTPError:
+                errors += 1
+                return
+            latencies.append(latency)
+            if not ok:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    return summarize(
+        f"{endpoint}:{scenario}",
+        latencies,
+        elapsed,
+        errors=errors,
+        endpoint=endpoint,
+        scenario=scenario,
+        concurrency=requests if scenario == "burst" else concurrency,
+    )
+
+
+async def run_all(base_url, endpoints, scenarios, requests, concurrency):
+    limits = httpx.Limits(max_connections=max(concurrency, requests))
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        results = []
+        for endpoint in endpoints:
+            for scenario in scenarios:
+                results.append(
+                    await run_scenario(client, endpoint, scenario, requests, concurrency)
+                )
+        return results
+
+
+@cli.command()
+def main(
+    base_url: str = typer.Option("http://localhost:8080", help="Place Wrapper base URL"),
+    endpoint: list[str] = typer.Option(list(ENDPOINTS), help="Endpoints to exercise"),
+    scenario: list[str] = typer.Option(["hot", "cold", "burst"], help="Scenarios to run"),
+    requests: int = typer.Option(200, help="Requests per scenario"),
+    concurrency: int = typer.Option(20, help="Concurrent requests for hot/cold"),
+    output: str = typer.Option(None, help="Append JSON lines to this file"),
+):
+    unknown = set(endpoint) - set(ENDPOINTS)
+    if unknown:
+        raise typer.BadParameter(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+    results = asyncio.run(run_all(base_url, endpoint, scenario, requests, concurrency))
+    write_results(results, output)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,75 @@
+"""
+Micro-benchmarks for the normalization functions.
+
+    python -m bench.micro --iterations 200 --places 20 --output bench_output.txt
+"""
+import os
+import time
+
+import typer
+
+# The handlers read the API key at import time; benchmarks never reach Google
+os.environ.setdefault("GOOGLEMAPSAPIKEY", "benchmark")
+
+from app.handlers.fetch_places_handler import (  # noqa: E402
+    normalize_google_response,
+    normalize_google_response_json,
+)
+from app.handlers.get_places_handler import normalize_place_response  # noqa: E402
+from bench import fixtures  # noqa: E402
+from bench.stats import summarize, write_results  # noqa: E402
+
+cli = typer.Typer()
+
+
+def run(name: str, func, payload, iterations: int, **extra):
+    # Warm up so import/first-call costs are not measured
+    for _ in range(min(10, iterations)):
+        func(payload)
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        func(payload)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    return summarize(name, latencies, elapsed, **extra)
+
+
+@cli.command()
+def main(
+    iterations: int = typer.Option(200, help="Iterations per benchmark"),
+    places: int = typer.Option(20, help="Places per nearby/text search payload"),
+    output: str = typer.Option(None, help="Append JSON lines to this file"),
+):
+    nearby = fixtures.search_nearby(places)["places"]
+    details = fixtures.place_details()
+
+    results = [
+        run(
+            "normalize_google_response",
+            normalize_google_response,
+            nearby,
+            iterations,
+            places=len(nearby),
+        ),
+        run(
+            "normalize_google_response_json",
+            normalize_google_response_json,
+            nearby,
+            iterations,
+            places=len(nearby),
+        ),
+        run(
+            "normalize_place_response",
+            normalize_place_response,
+            details,
+            iterations,
+        ),
+    ]
+    write_results(results, output)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,103 @@
+"""
+Local stand-in for the Google Places / Geocoding APIs.
+
+Run it and point the service at it:
+
+    uvicorn bench.mock_google:app --port 9090
+    GOOGLE_PLACES_API_URL=http://localhost:9090/v1 \
+    GOOGLE_GEOCODE_API_URL=http://localhost:9090/maps/api/geocode/json \
+    uvicorn app.main:app --port 8080
+
+Behaviour is tuned with environment variables:
+    MOCK_LATENCY_MS   base latency added to every response (default 50)
+    MOCK_JITTER_MS    uniform random jitter on top of the latency (default 20)
+    MOCK_ERROR_RATE   fraction of requests answered with MOCK_ERROR_STATUS (default 0)
+    MOCK_ERROR_STATUS status code used for injected errors (default 503)
+    MOCK_PLACES_COUNT places returned per search (default 20)
+"""
+import asyncio
+import os
+import random
+
+from fastapi import FastAPI, Body, Request
+from fastapi.responses import JSONResponse
+
+from bench import fixtures
+
+LATENCY_MS = float(os.getenv("MOCK_LATENCY_MS", 50))
+JITTER_MS = float(os.getenv("MOCK_JITTER_MS", 20))
+ERROR_RATE = float(os.getenv("MOCK_ERROR_RATE", 0))
+ERROR_STATUS = int(os.getenv("MOCK_ERROR_STATUS", 503))
+PLACES_COUNT = int(os.getenv("MOCK_PLACES_COUNT", 20))
+
+app = FastAPI(title="Mock Google Places")
+
+# Calls received per endpoint, exposed on /_stats so benchmarks can count upstream traffic
+calls: dict[str, int] = {}
+
+
+def _endpoint_name(path: str) -> str:
+    if path.endswith("/media"):
+        return "photo_media"
+    if path.startswith("/v1/places/"):
+        return "place_details"
+    return path.rsplit("/", 1)[-1]
+
+
+@app.middleware("http")
+async def simulate_upstream(request: Request, call_next):
+    """Apply latency, jitter and error injection to every upstream call."""
+    if request.url.path.startswith("/_stats"):
+        return await call_next(request)
+
+    endpoint = _endpoint_name(request.url.path)
+    calls[endpoint] = calls.get(endpoint, 0) + 1
+    await asyncio.sleep((LATENCY_MS + random.uniform(0, JITTER_MS)) / 1000)
+
+    if random.random() < ERROR_RATE:
+        return JSONResponse(
+            status_code=ERROR_STATUS,
+            content={"error": {"code": ERROR_STATUS, "message": "Injected error"}},
+        )
+    return await call_next(request)
+
+
+@app.post("/v1/places:searchNearby")
+async def search_nearby(body: dict = Body(...)):
+    return fixtures.search_nearby(PLACES_COUNT)
+
+
+@app.post("/v1/places:searchText")
+async def search_text(body: dict = Body(...)):
+    return fixtures.search_text(PLACES_COUNT)
+
+
+@app.post("/v1/places:autocomplete")
+async def autocomplete(body: dict = Body(...)):
+    return fixtures.autocomplete(body.get("input", ""))
+
+
+@app.get("/v1/places/{place_id}/photos/{photo_id}/media")
+async def photo_media(place_id: str, photo_id: str):
+    return fixtures.photo_media(f"places/{place_id}/photos/{photo_id}")
+
+
+@app.get("/v1/places/{place_id}")
+async def place_details(place_id: str):
+    return fixtures.place_details(place_id)
+
+
+@app.get("/maps/api/geocode/json")
+async def geocode(address: str = ""):
+    return fixtures.geocode(address)
+
+
+@app.get("/_stats")
+async def stats():
+    return {"calls": calls}
+
+
+@app.delete("/_stats")
+async def reset_stats():
+    calls.clear()
+    return {"calls": calls}
@@ -0,0 +1,41 @@
+import json
+import statistics
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(name: str, latencies: list[float], elapsed: float, errors: int = 0, **extra):
+    """
+    Build a result record from per-operation latencies (seconds).
+    Latencies are reported in milliseconds, throughput in operations per second.
+    """
+    values = sorted(latencies)
+    result = {
+        "name": name,
+        "count": len(values),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_ops": round(len(values) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(values) * 1000, 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+    }
+    result.update(extra)
+    return result
+
+
+def write_results(results: list[dict], output: str | None):
+    """Write results as JSON lines to a file, or to stdout when no file is given."""
+    lines = "\n".join(json.dumps(result) for result in results) + "\n"
+    if output:
+        with open(output, "a") as f:
+            f.write(lines)
+    else:
+        print(lines, end="")